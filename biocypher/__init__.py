@@ -23,18 +23,18 @@ __all__ = [
     'BioCypher',
 ]
 
-from ._core import BioCypher
 from ._config import config, module_data
 from ._logger import log, logger, logfile
 from ._metadata import __author__, __version__
 
 
-class Driver(BioCypher):
+def __getattr__(name):
+    # the core pulls in the ontology stack and the DBMS drivers; load it on
+    # first access instead of at package import
+    if name in ('BioCypher', 'Driver'):
 
-    # initialise parent class but log a warning
-    def __init__(self, *args, **kwargs):
-        logger.warning(
-            'The class `Driver` is deprecated and will be removed in a future '
-            'release. Please use `BioCypher` instead.'
-        )
-        super().__init__(*args, **kwargs)
+        from . import _core
+
+        return getattr(_core, name)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -146,17 +146,22 @@ class _Neo4jDriver():
 
         logger.info('Creating constraints for node types in config.')
 
-        # get structure
-        for leaf in self._ontology.extended_schema.items():
-            label = _misc.sentencecase_to_pascalcase(leaf[0])
-            if leaf[1]['represented_as'] == 'node':
-
-                s = (
-                    f'CREATE CONSTRAINT `{label}_id` '
-                    f'IF NOT EXISTS ON (n:`{label}`) '
-                    'ASSERT n.id IS UNIQUE'
-                )
-                self._driver.query(s)
+        # get structure; several schema entries can share a label, only
+        # send one query per label (the driver runs one statement each)
+        labels = dict.fromkeys(
+            _misc.sentencecase_to_pascalcase(leaf[0])
+            for leaf in self._ontology.extended_schema.items()
+            if leaf[1]['represented_as'] == 'node'
+        )
+
+        for label in labels:
+
+            s = (
+                f'CREATE CONSTRAINT `{label}_id` '
+                f'IF NOT EXISTS ON (n:`{label}`) '
+                'ASSERT n.id IS UNIQUE'
+            )
+            self._driver.query(s)
 
     def add_nodes(self, id_type_tuples: Iterable[tuple]) -> tuple:
         """
@@ -247,9 +252,11 @@ class _Neo4jDriver():
 
         try:
 
-            nodes = _misc.to_list(nodes)
-
-            entities = [node.get_dict() for node in nodes]
+            # build the entities straight from the input; listing the
+            # nodes first would keep all of them alive next to their dicts
+            entities = [
+                node.get_dict() for node in _misc.ensure_iterable(nodes)
+            ]
 
         except AttributeError:
 
@@ -320,7 +327,11 @@ class _Neo4jDriver():
         """
 
         edges = _misc.ensure_iterable(edges)
-        edges = itertools.chain(*(_misc.ensure_iterable(i) for i in edges))
+        # flatten lazily: unpacking with `chain(*...)` would run through
+        # all edges once before the loop below
+        edges = itertools.chain.from_iterable(
+            _misc.ensure_iterable(i) for i in edges
+        )
 
         nodes = []
         rels = []
@@ -12,22 +12,25 @@
 BioCypher core module. Interfaces with the user and distributes tasks to
 submodules.
 """
-from more_itertools import peekable
-
 from ._logger import logger
 
 logger.debug(f'Loading module {__name__}.')
 
+import itertools
+
 from ._write import get_writer
 from ._config import config as _config
 from ._config import update_from_file as _file_update
 from ._create import BioCypherEdge, BioCypherNode
-from ._connect import get_driver
 from ._mapping import OntologyMapping
 from ._ontology import Ontology
 from ._translate import Translator
 
-__all__ = ['BioCypher']
+__all__ = ['BioCypher', 'Driver']
+
+# default for `next()` on the input, to tell empty input from a first
+# element that happens to be `None`
+_EMPTY = object()
 
 SUPPORTED_DBMS = ['neo4j']
 
@@ -147,6 +150,7 @@ class BioCypher:
         self._translator = None
         self._ontology = None
         self._writer = None
+        self._driver = None
 
     def _get_ontology_mapping(self):
         """
@@ -210,6 +214,9 @@ class BioCypher:
         """
 
         if not self._offline:
+            # the Neo4j driver is only needed in online mode
+            from ._connect import get_driver
+
             self._driver = get_driver(
                 dbms=self._dbms,
                 translator=self._get_translator(),
@@ -218,37 +225,63 @@ class BioCypher:
         else:
             raise NotImplementedError('Cannot get driver in offline mode.')
 
-    def write_nodes(self, nodes):
+    def write_nodes(self, nodes, batch_size: int = int(1e6)):
         """
         Write nodes to database.
+
+        Args:
+
+            nodes (iterable): Nodes as :class:`BioCypherNode` objects or as
+                tuples to be translated.
+
+            batch_size (int): Number of nodes per label that are collected
+                in memory before being written to a new part file.
         """
 
         if not self._writer:
             self._get_writer()
 
-        nodes = peekable(nodes)
-        if not isinstance(nodes.peek(), BioCypherNode):
+        nodes = iter(nodes)
+        first = next(nodes, _EMPTY)
+        if first is _EMPTY:
+            logger.debug('No nodes to write.')
+            return True
+        nodes = itertools.chain([first], nodes)
+        if not isinstance(first, BioCypherNode):
             tnodes = self._translator.translate_nodes(nodes)
         else:
             tnodes = nodes
         # write node files
-        return self._writer.write_nodes(tnodes)
+        return self._writer.write_nodes(tnodes, batch_size=batch_size)
 
-    def write_edges(self, edges):
+    def write_edges(self, edges, batch_size: int = int(1e6)):
         """
         Write edges to database.
+
+        Args:
+
+            edges (iterable): Edges as :class:`BioCypherEdge` objects or as
+                tuples to be translated.
+
+            batch_size (int): Number of edges per label that are collected
+                in memory before being written to a new part file.
         """
 
         if not self._writer:
             self._get_writer()
 
-        edges = peekable(edges)
-        if not isinstance(edges.peek(), BioCypherEdge):
+        edges = iter(edges)
+        first = next(edges, _EMPTY)
+        if first is _EMPTY:
+            logger.debug('No edges to write.')
+            return True
+        edges = itertools.chain([first], edges)
+        if not isinstance(first, BioCypherEdge):
             tedges = self._translator.translate_edges(edges)
         else:
             tedges = edges
         # write edge files
-        return self._writer.write_edges(tedges)
+        return self._writer.write_edges(tedges, batch_size=batch_size)
 
     def add_nodes(self, nodes):
         pass
@@ -264,8 +297,13 @@ class BioCypher:
         if not self._driver:
             self._get_driver()
 
-        nodes = peekable(nodes)
-        if not isinstance(nodes.peek(), BioCypherNode):
+        nodes = iter(nodes)
+        first = next(nodes, _EMPTY)
+        if first is _EMPTY:
+            logger.debug('No nodes to merge.')
+            return True
+        nodes = itertools.chain([first], nodes)
+        if not isinstance(first, BioCypherNode):
             tnodes = self._translator.translate_nodes(nodes)
         else:
             tnodes = nodes
@@ -395,37 +433,40 @@ class BioCypher:
         Translate a term to its BioCypher equivalent.
         """
 
-        # instantiate adapter if not exists
-        self.start_ontology()
-
-        return self._translator.translate_term(term)
+        # instantiate translator if not exists
+        return self._get_translator().translate_term(term)
 
     def reverse_translate_term(self, term: str) -> str:
         """
         Reverse translate a term from its BioCypher equivalent.
         """
 
-        # instantiate adapter if not exists
-        self.start_ontology()
-
-        return self._translator.reverse_translate_term(term)
+        # instantiate translator if not exists
+        return self._get_translator().reverse_translate_term(term)
 
     def translate_query(self, query: str) -> str:
         """
         Translate a query to its BioCypher equivalent.
         """
 
-        # instantiate adapter if not exists
-        self.start_ontology()
-
-        return self._translator.translate(query)
+        # instantiate translator if not exists
+        return self._get_translator().translate(query)
 
     def reverse_translate_query(self, query: str) -> str:
         """
         Reverse translate a query from its BioCypher equivalent.
         """
 
-        # instantiate adapter if not exists
-        self.start_ontology()
+        # instantiate translator if not exists
+        return self._get_translator().reverse_translate(query)
+
 
-        return self._translator.reverse_translate(query)
+class Driver(BioCypher):
+
+    # initialise parent class but log a warning
+    def __init__(self, *args, **kwargs):
+        logger.warning(
+            'The class `Driver` is deprecated and will be removed in a future '
+            'release. Please use `BioCypher` instead.'
+        )
+        super().__init__(*args, **kwargs)
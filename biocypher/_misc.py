@@ -53,13 +53,24 @@ LIST_LIKE = (
     ValuesView,
 )
 
+# exact types for a hash lookup before the (slower, ABC based) isinstance
+# check against the tuples above
+_SIMPLE_TYPES_EXACT = frozenset(SIMPLE_TYPES)
+_LIST_LIKE_EXACT = frozenset((list, set, tuple, dict))
+
 
 def to_list(value: Any) -> list:
     """
     Ensures that ``value`` is a list.
     """
 
-    if isinstance(value, LIST_LIKE):
+    _type = type(value)
+
+    if _type in _SIMPLE_TYPES_EXACT:
+
+        value = [value]
+
+    elif _type in _LIST_LIKE_EXACT or isinstance(value, LIST_LIKE):
 
         value = list(value)
 
@@ -75,6 +86,16 @@ def ensure_iterable(value: Any) -> Iterable:
     Returns iterables, except strings, wraps simple types into tuple.
     """
 
+    _type = type(value)
+
+    if _type in _LIST_LIKE_EXACT:
+
+        return value
+
+    if _type in _SIMPLE_TYPES_EXACT:
+
+        return (value, )
+
     return value if isinstance(value, LIST_LIKE) else (value, )
 
 
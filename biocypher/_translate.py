@@ -18,8 +18,7 @@ logger.debug(f'Loading module {__name__}.')
 
 from typing import Any, Union, Optional
 from collections.abc import Iterable, Generator
-
-from more_itertools import peekable
+import itertools
 
 from . import _misc
 from ._create import BioCypherEdge, BioCypherNode, BioCypherRelAsNode
@@ -27,6 +26,9 @@ from ._mapping import OntologyMapping
 
 __all__ = ['BiolinkAdapter', 'Translator']
 
+# default for `next()`, so a `None` tuple is not taken for empty input
+_EMPTY = object()
+
 
 class Translator:
     """
@@ -87,10 +89,13 @@ class Translator:
 
         self._log_begin_translate(id_type_prop_tuples, 'nodes')
 
-        for _id, _type, _props in id_type_prop_tuples:
+        # check for strict mode requirements
+        required_props = ['source', 'licence', 'version']
 
-            # check for strict mode requirements
-            required_props = ['source', 'licence', 'version']
+        # ontology class and preferred id, resolved once per input type
+        resolved = {}
+
+        for _id, _type, _props in id_type_prop_tuples:
 
             if self.strict_mode:
                 # rename 'license' to 'licence' in _props
@@ -104,17 +109,24 @@ class Translator:
                             'Strict mode is enabled, so this is not allowed.'
                         )
 
-            # find the node in leaves that represents biolink node type
-            _ontology_class = self._get_ontology_mapping(_type)
+            if _type not in resolved:
+
+                # find the node in leaves that represents biolink node type
+                _ontology_class = self._get_ontology_mapping(_type)
+
+                resolved[_type] = (
+                    _ontology_class,
+                    self._get_preferred_id(_ontology_class)
+                    if _ontology_class else None,
+                )
+
+            _ontology_class, _preferred_id = resolved[_type]
 
             if _ontology_class:
 
                 # filter properties for those specified in schema_config if any
                 _filtered_props = self._filter_props(_ontology_class, _props)
 
-                # preferred id
-                _preferred_id = self._get_preferred_id(_ontology_class)
-
                 yield BioCypherNode(
                     node_id=_id,
                     node_label=_ontology_class,
@@ -222,12 +234,22 @@ class Translator:
 
         # legacy: deal with 4-tuples (no edge id)
         # TODO remove for performance reasons once safe
-        id_src_tar_type_prop_tuples = peekable(id_src_tar_type_prop_tuples)
-        if len(id_src_tar_type_prop_tuples.peek()) == 4:
-            id_src_tar_type_prop_tuples = [
-                (None, src, tar, typ, props)
-                for src, tar, typ, props in id_src_tar_type_prop_tuples
-            ]
+        id_src_tar_type_prop_tuples = iter(id_src_tar_type_prop_tuples)
+        first = next(id_src_tar_type_prop_tuples, _EMPTY)
+        if first is not _EMPTY:
+            id_src_tar_type_prop_tuples = itertools.chain(
+                [first],
+                id_src_tar_type_prop_tuples,
+            )
+            if len(first) == 4:
+                id_src_tar_type_prop_tuples = (
+                    (None, src, tar, typ, props)
+                    for src, tar, typ, props in id_src_tar_type_prop_tuples
+                )
+
+        # ontology class, representation and edge label, resolved once per
+        # input type
+        resolved = {}
 
         for _id, _src, _tar, _type, _props in id_src_tar_type_prop_tuples:
 
@@ -244,17 +266,36 @@ class Translator:
                         ' This is required in strict mode.',
                     )
 
-            # match the input label (_type) to
-            # a Biolink label from schema_config
-            bl_type = self._get_ontology_mapping(_type)
+            if _type not in resolved:
+
+                # match the input label (_type) to
+                # a Biolink label from schema_config
+                bl_type = self._get_ontology_mapping(_type)
+
+                if bl_type:
+
+                    rep = self.extended_schema[bl_type]['represented_as']
+                    edge_label = self.extended_schema[bl_type].get(
+                        'label_as_edge'
+                    )
+
+                    if edge_label is None:
+
+                        edge_label = bl_type
+
+                else:
+
+                    rep = edge_label = None
+
+                resolved[_type] = bl_type, rep, edge_label
+
+            bl_type, rep, edge_label = resolved[_type]
 
             if bl_type:
 
                 # filter properties for those specified in schema_config if any
                 _filtered_props = self._filter_props(bl_type, _props)
 
-                rep = self.extended_schema[bl_type]['represented_as']
-
                 if rep == 'node':
 
                     if _id:
@@ -311,14 +352,6 @@ class Translator:
 
                 else:
 
-                    edge_label = self.extended_schema[bl_type].get(
-                        'label_as_edge'
-                    )
-
-                    if edge_label is None:
-
-                        edge_label = bl_type
-
                     yield BioCypherEdge(
                         relationship_id=_id,
                         source_id=_src,
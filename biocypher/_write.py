@@ -12,7 +12,7 @@
 BioCypher 'offline' module. Handles the writing of node and edge representations
 suitable for import into a DBMS.
 """
-import glob
+import re
 
 from ._logger import logger
 
@@ -21,10 +21,10 @@ logger.debug(f'Loading module {__name__}.')
 from types import GeneratorType
 from typing import TYPE_CHECKING, Union, Optional
 from datetime import datetime
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
 import os
-
-from more_itertools import peekable
+import itertools
 
 from ._config import config as _config
 from ._create import BioCypherEdge, BioCypherNode, BioCypherRelAsNode
@@ -36,6 +36,40 @@ if TYPE_CHECKING:
     from ._ontology import Ontology
     from ._translate import Translator
 
+# part files written by the batch writer, `{label}-part{number}.csv`
+_PART_FILE = re.compile(r'(.+)-part(\d+)\.csv$')
+
+# header type suffixes of edge property types, others are untyped
+_EDGE_TYPE_SUFFIX = {
+    'int': ':long',
+    'long': ':long',
+    'float': ':double',
+    'double': ':double',
+    'bool': ':boolean',  # TODO does Neo4j support bool?
+    'boolean': ':boolean',
+}
+
+# header type suffixes of node property types, others are untyped
+_NODE_TYPE_SUFFIX = {
+    'int': ':long',
+    'long': ':long',
+    'float': ':double',
+    'double': ':double',
+    'dbl': ':double',
+    'bool': ':boolean',  # TODO Neo4j boolean support / spelling?
+    'boolean': ':boolean',
+    'str[]': ':string[]',
+    'string[]': ':string[]',
+}
+
+# default for `next()` to detect empty input
+_EMPTY = object()
+
+# property types written without quotes
+_NUMERIC_TYPES = frozenset(
+    ('int', 'long', 'float', 'double', 'dbl', 'bool', 'boolean'),
+)
+
 
 class _Neo4jBatchWriter:
     """
@@ -170,6 +204,24 @@ class _Neo4jBatchWriter:
         # TODO not memory efficient, but should be fine for most cases; is
         # there a more elegant solution?
 
+        self._node_labels = {}  # dict to store the concatenated labels
+        # of each node type written; computed from the ontology once
+
+        self._pascal_labels = {}  # dict to store the PascalCase version
+        # of each label; labels are few but written on every edge row
+
+        self._next_parts = {}  # dict to store the next part number of
+        # each PascalCase label; parts already in the output directory
+        # are counted once here instead of listed before every part
+        for f in os.listdir(self.outdir):
+            m = _PART_FILE.match(f)
+            if m:
+                label, part = m.group(1), int(m.group(2))
+                self._next_parts[label] = max(
+                    self._next_parts.get(label, 0),
+                    part + 1,
+                )
+
     def _process_delimiter(self, delimiter: str) -> str:
         """
         Return escaped characters in case of receiving their string
@@ -184,6 +236,18 @@ class _Neo4jBatchWriter:
 
             return delimiter, delimiter
 
+    def _pascal(self, label: str) -> str:
+        """
+        Return the PascalCase disk representation of a sentence case
+        label, converting each distinct label only once.
+        """
+
+        pascal = self._pascal_labels.get(label)
+        if pascal is None:
+            pascal = self.translator.name_sentence_to_pascal(label)
+            self._pascal_labels[label] = pascal
+        return pascal
+
     def write_nodes(self, nodes, batch_size=int(1e6)):
         """
         Wrapper for writing nodes and their headers.
@@ -227,32 +291,26 @@ class _Neo4jBatchWriter:
             bool: The return value. True for success, False otherwise.
         """
         passed = False
-        # unwrap generator in one step
-        edges = list(edges)  # force evaluation to handle empty generator
-        if edges:
-            z = zip(
-                *(
-                    (
-                        e.get_node(),
-                        [
-                            e.get_source_edge(),
-                            e.get_target_edge(),
-                        ],
-                    ) if isinstance(e, BioCypherRelAsNode) else (None, [e])
-                    for e in edges
-                )
-            )
-            nod, edg = (list(a) for a in z)
-            nod = [n for n in nod if n]
-            edg = [val for sublist in edg for val in sublist]  # flatten
-
-            if nod and edg:
-                passed = self.write_nodes(nod) and self._write_edge_data(
-                    edg,
-                    batch_size,
-                )
-            else:
-                passed = self._write_edge_data(edg, batch_size)
+        edges = iter(edges)
+        first = next(edges, _EMPTY)
+        if first is not _EMPTY:
+            # stream edges through without materialising them; relationships
+            # represented as nodes contribute their source and target edges
+            # to the stream, their nodes are collected and written after
+            nod = []
+
+            def edg():
+                for e in itertools.chain((first, ), edges):
+                    if isinstance(e, BioCypherRelAsNode):
+                        nod.append(e.get_node())
+                        yield e.get_source_edge()
+                        yield e.get_target_edge()
+                    else:
+                        yield e
+
+            passed = self._write_edge_data(edg(), batch_size)
+            if passed and nod:
+                passed = self.write_nodes(nod, batch_size)
 
         else:
             # is this a problem? if the generator or list is empty, we
@@ -260,7 +318,6 @@ class _Neo4jBatchWriter:
             logger.debug(
                 'No edges to write, possibly due to no matched Biolink classes.',
             )
-            pass
 
         if not passed:
             logger.error('Error while writing edge data.')
@@ -290,13 +347,11 @@ class _Neo4jBatchWriter:
             bool: The return value. True for success, False otherwise.
         """
 
-        if isinstance(nodes, GeneratorType) or isinstance(nodes, peekable):
+        if isinstance(nodes, Iterator):
             logger.debug('Writing node CSV from generator.')
 
             bins = defaultdict(list)  # dict to store a list for each
             # label that is passed in
-            bin_l = {}  # dict to store the length of each list for
-            # batching cutoff
             reference_props = defaultdict(
                 dict,
             )  # dict to store a dict of properties
@@ -323,11 +378,18 @@ class _Neo4jBatchWriter:
                         )
                     continue
 
-                if not label in bins.keys():
+                if not label in bins:
                     # start new list
                     all_labels = None
                     bins[label].append(node)
-                    bin_l[label] = 1
+
+                    if label in self.node_property_dict:
+                        # written in an earlier call; reuse the properties
+                        # its header was written with and its labels
+                        reference_props[label] = self.node_property_dict[label]
+                        labels[label] = self._node_labels[label]
+                        self.seen_node_ids.add(_id)
+                        continue
 
                     # get properties from config if present
                     cprops = self.extended_schema.get(label).get('properties', )
@@ -366,32 +428,28 @@ class _Neo4jBatchWriter:
                     all_labels = self.ontology.get_ancestors(label)
 
                     if all_labels:
-                        # convert to pascal case
-                        all_labels = [
-                            self.translator.name_sentence_to_pascal(label)
+                        # convert to pascal case, removing duplicates
+                        all_labels = {
+                            self._pascal(label)
                             for label in all_labels
-                        ]
-                        # remove duplicates
-                        all_labels = list(OrderedDict.fromkeys(all_labels))
-                        # order alphabetically
-                        all_labels.sort()
-                        # concatenate with array delimiter
-                        all_labels = self.adelim.join(all_labels)
+                        }
+                        # order alphabetically, concatenate with array
+                        # delimiter
+                        all_labels = self.adelim.join(sorted(all_labels))
                     else:
-                        all_labels = self.translator.name_sentence_to_pascal(
-                            label
-                        )
+                        all_labels = self._pascal(label)
 
                     labels[label] = all_labels
+                    self._node_labels[label] = all_labels
 
                 else:
                     # add to list
-                    bins[label].append(node)
-                    bin_l[label] += 1
-                    if not bin_l[label] < batch_size:
+                    batch = bins[label]
+                    batch.append(node)
+                    if len(batch) >= batch_size:
                         # batch size controlled here
                         passed = self._write_single_node_list_to_file(
-                            bins[label],
+                            batch,
                             label,
                             reference_props[label],
                             labels[label],
@@ -400,8 +458,7 @@ class _Neo4jBatchWriter:
                         if not passed:
                             return False
 
-                        bins[label] = []
-                        bin_l[label] = 0
+                        batch.clear()
 
                 self.seen_node_ids.add(_id)
 
@@ -423,7 +480,7 @@ class _Neo4jBatchWriter:
             # properties in the generator pass
 
             # save config or first-node properties to instance attribute
-            for label in reference_props.keys():
+            for label in reference_props:
                 self.node_property_dict[label] = reference_props[label]
 
             return True
@@ -432,11 +489,9 @@ class _Neo4jBatchWriter:
                 logger.error('Nodes must be passed as list or generator.')
                 return False
             else:
-
-                def gen(nodes):
-                    yield from nodes
-
-                return self._write_node_data(gen(nodes), batch_size=batch_size)
+                # the list iterator takes the iterator path without a
+                # generator frame per element
+                return self._write_node_data(iter(nodes), batch_size=batch_size)
 
     def _write_node_headers(self):
         """
@@ -465,7 +520,7 @@ class _Neo4jBatchWriter:
             # via the schema_config.yaml.
 
             # translate label to PascalCase
-            pascal_label = self.translator.name_sentence_to_pascal(label)
+            pascal_label = self._pascal(label)
 
             header_path = os.path.join(
                 self.outdir,
@@ -477,24 +532,13 @@ class _Neo4jBatchWriter:
             if not os.path.exists(header_path):
 
                 # concatenate key:value in props
-                props_list = []
-                for k, v in props.items():
-                    if v in ['int', 'long']:
-                        props_list.append(f'{k}:long')
-                    elif v in ['float', 'double', 'dbl']:
-                        props_list.append(f'{k}:double')
-                    elif v in ['bool', 'boolean']:
-                        # TODO Neo4j boolean support / spelling?
-                        props_list.append(f'{k}:boolean')
-                    elif v in ['str[]', 'string[]']:
-                        props_list.append(f'{k}:string[]')
-                    else:
-                        props_list.append(f'{k}')
+                props_list = [
+                    f"{k}{_NODE_TYPE_SUFFIX.get(v, '')}"
+                    for k, v in props.items()
+                ]
 
-                # create list of lists and flatten
-                # removes need for empty check of property list
-                out_list = [[_id], props_list, [':LABEL']]
-                out_list = [val for sublist in out_list for val in sublist]
+                # unpacking removes need for empty check of property list
+                out_list = (_id, *props_list, ':LABEL')
 
                 with open(header_path, 'w', encoding='utf-8') as f:
 
@@ -546,20 +590,19 @@ class _Neo4jBatchWriter:
             logger.error('Nodes must be passed as type BioCypherNode.')
             return False
 
-        # from list of nodes to list of strings
-        lines = []
+        # reference properties
+        ref_props = list(prop_dict.keys())
+        ref_set = frozenset(ref_props)
 
+        # check for deviations in properties before anything is written
         for n in node_list:
 
-            # check for deviations in properties
             # node properties
             n_props = n.get_properties()
-            n_keys = list(n_props.keys())
-            # reference properties
-            ref_props = list(prop_dict.keys())
 
-            # compare lists order invariant
-            if not set(ref_props) == set(n_keys):
+            # compare keys order invariant; keys views compare as sets
+            if n_props.keys() != ref_set:
+                n_keys = list(n_props.keys())
                 onode = n.get_id()
                 oprop1 = set(ref_props).difference(n_keys)
                 oprop2 = set(n_keys).difference(ref_props)
@@ -573,44 +616,67 @@ class _Neo4jBatchWriter:
                 )
                 return False
 
+        # avoid writing empty files
+        if node_list:
+            self._write_next_part(
+                label,
+                self._node_lines(node_list, prop_dict, labels),
+                len(node_list),
+            )
+
+        return True
+
+    def _node_lines(self, node_list: list, prop_dict: dict, labels: str):
+        """
+        Generates the CSV lines for a list of biocypher nodes, one per
+        node, so they can be streamed to disk without building the whole
+        part file in memory.
+
+        Args:
+            node_list (list): list of BioCypherNodes to be written
+            prop_dict (dict): properties of node class passed from parsing
+                function and their types
+            labels (str): string of one or several concatenated labels
+                for the node class
+
+        Yields:
+            str: one line of the part file, including the line break
+        """
+
+        # classify properties once per batch instead of once per node and
+        # property: numeric types are written as they are, others quoted
+        prop_types = tuple(
+            (k, v in _NUMERIC_TYPES) for k, v in prop_dict.items()
+        )
+        # bind to locals, looked up for every property of every row
+        delim, adelim, quote = self.delim, self.adelim, self.quote
+
+        for n in node_list:
+
+            n_props = n.get_properties()
+
             line = [n.get_id()]
 
-            if ref_props:
+            if prop_dict:
 
                 plist = []
                 # make all into strings, put actual strings in quotes
-                for k, v in prop_dict.items():
+                for k, numeric in prop_types:
                     p = n_props.get(k)
                     if p is None:  # TODO make field empty instead of ""?
                         plist.append('')
-                    elif v in [
-                        'int',
-                        'long',
-                        'float',
-                        'double',
-                        'dbl',
-                        'bool',
-                        'boolean',
-                    ]:
+                    elif numeric:
                         plist.append(str(p))
                     else:
                         if isinstance(p, list):
-                            plist.append(
-                                self.quote + self.adelim.join(p) + self.quote
-                            )
+                            plist.append(f'{quote}{adelim.join(p)}{quote}')
                         else:
-                            plist.append(self.quote + str(p) + self.quote)
+                            plist.append(f'{quote}{p!s}{quote}')
 
-                line.append(self.delim.join(plist))
+                line.append(delim.join(plist))
             line.append(labels)
 
-            lines.append(self.delim.join(line) + '\n')
-
-        # avoid writing empty files
-        if lines:
-            self._write_next_part(label, lines)
-
-        return True
+            yield delim.join(line) + '\n'
 
     def _write_edge_data(self, edges, batch_size):
         """
@@ -633,13 +699,11 @@ class _Neo4jBatchWriter:
               called on one iterable containing one type of edge only
         """
 
-        if isinstance(edges, GeneratorType):
+        if isinstance(edges, Iterator):
             logger.debug('Writing edge CSV from generator.')
 
             bins = defaultdict(list)  # dict to store a list for each
             # label that is passed in
-            bin_l = {}  # dict to store the length of each list for
-            # batching cutoff
             reference_props = defaultdict(
                 dict,
             )  # dict to store a dict of properties
@@ -663,14 +727,17 @@ class _Neo4jBatchWriter:
 
                 label = e.get_label()
 
-                if not label in self.seen_edges.keys():
-                    self.seen_edges[label] = set()
+                seen = self.seen_edges.get(label)
+                if seen is None:
+                    seen = self.seen_edges[label] = set()
 
-                src_tar_id = '_'.join([e.get_source_id(), e.get_target_id()])
+                # tuple rather than joined string: no new string per edge,
+                # and ids containing the separator cannot collide
+                src_tar_id = (e.get_source_id(), e.get_target_id())
 
                 # check for duplicates
-                if src_tar_id in self.seen_edges.get(label, set()):
-                    self.duplicate_edge_ids.add(src_tar_id)
+                if src_tar_id in seen:
+                    self.duplicate_edge_ids.add('_'.join(src_tar_id))
                     if not label in self.duplicate_edge_types:
                         self.duplicate_edge_types.add(label)
                         logger.warning(
@@ -679,12 +746,11 @@ class _Neo4jBatchWriter:
                     continue
 
                 else:
-                    self.seen_edges[label].add(src_tar_id)
+                    seen.add(src_tar_id)
 
-                if not label in bins.keys():
+                if not label in bins:
                     # start new list
                     bins[label].append(e)
-                    bin_l[label] = 1
 
                     # get properties from config if present
 
@@ -731,12 +797,12 @@ class _Neo4jBatchWriter:
 
                 else:
                     # add to list
-                    bins[label].append(e)
-                    bin_l[label] += 1
-                    if not bin_l[label] < batch_size:
+                    batch = bins[label]
+                    batch.append(e)
+                    if len(batch) >= batch_size:
                         # batch size controlled here
                         passed = self._write_single_edge_list_to_file(
-                            bins[label],
+                            batch,
                             label,
                             reference_props[label],
                         )
@@ -744,8 +810,7 @@ class _Neo4jBatchWriter:
                         if not passed:
                             return False
 
-                        bins[label] = []
-                        bin_l[label] = 0
+                        batch.clear()
 
             # after generator depleted, write remainder of bins
             for label, nl in bins.items():
@@ -765,7 +830,7 @@ class _Neo4jBatchWriter:
             # properties in the generator pass
 
             # save first-edge properties to instance attribute
-            for label in reference_props.keys():
+            for label in reference_props:
                 self.edge_property_dict[label] = reference_props[label]
 
             return True
@@ -774,11 +839,9 @@ class _Neo4jBatchWriter:
                 logger.error('Edges must be passed as list or generator.')
                 return False
             else:
-
-                def gen(edges):
-                    yield from edges
-
-                return self._write_edge_data(gen(edges), batch_size=batch_size)
+                # the list iterator takes the iterator path without a
+                # generator frame per element
+                return self._write_edge_data(iter(edges), batch_size=batch_size)
 
     def _write_edge_headers(self):
         """
@@ -801,7 +864,7 @@ class _Neo4jBatchWriter:
             # :END_ID, :TYPE
 
             # translate label to PascalCase
-            pascal_label = self.translator.name_sentence_to_pascal(label)
+            pascal_label = self._pascal(label)
 
             # paths
             header_path = os.path.join(
@@ -814,24 +877,13 @@ class _Neo4jBatchWriter:
             if not os.path.exists(header_path):
 
                 # concatenate key:value in props
-                props_list = []
-                for k, v in props.items():
-                    if v in ['int', 'long']:
-                        props_list.append(f'{k}:long')
-                    elif v in ['float', 'double']:
-                        props_list.append(f'{k}:double')
-                    elif v in [
-                        'bool',
-                        'boolean',
-                    ]:  # TODO does Neo4j support bool?
-                        props_list.append(f'{k}:boolean')
-                    else:
-                        props_list.append(f'{k}')
+                props_list = [
+                    f"{k}{_EDGE_TYPE_SUFFIX.get(v, '')}"
+                    for k, v in props.items()
+                ]
 
-                # create list of lists and flatten
-                # removes need for empty check of property list
-                out_list = [[':START_ID'], props_list, [':END_ID'], [':TYPE']]
-                out_list = [val for sublist in out_list for val in sublist]
+                # unpacking removes need for empty check of property list
+                out_list = (':START_ID', *props_list, ':END_ID', ':TYPE')
 
                 with open(header_path, 'w', encoding='utf-8') as f:
 
@@ -884,17 +936,18 @@ class _Neo4jBatchWriter:
             logger.error('Edges must be passed as type BioCypherEdge.')
             return False
 
-        # from list of edges to list of strings
-        lines = []
+        ref_props = list(prop_dict.keys())
+        ref_set = frozenset(ref_props)
+
+        # check for deviations in properties before anything is written
         for e in edge_list:
-            # check for deviations in properties
+
             # edge properties
             e_props = e.get_properties()
-            e_keys = list(e_props.keys())
-            ref_props = list(prop_dict.keys())
 
-            # compare list order invariant
-            if not set(ref_props) == set(e_keys):
+            # compare keys order invariant; keys views compare as sets
+            if e_props.keys() != ref_set:
+                e_keys = list(e_props.keys())
                 oedge = f'{e.get_source_id()}-{e.get_target_id()}'
                 oprop1 = set(ref_props).difference(e_keys)
                 oprop2 = set(e_keys).difference(ref_props)
@@ -908,112 +961,138 @@ class _Neo4jBatchWriter:
                 )
                 return False
 
-            if ref_props:
+        # avoid writing empty files
+        if edge_list:
+            self._write_next_part(
+                label,
+                self._edge_lines(edge_list, prop_dict),
+                len(edge_list),
+            )
+
+        return True
+
+    def _edge_lines(self, edge_list: list, prop_dict: dict):
+        """
+        Generates the CSV lines for a list of biocypher edges, one per
+        edge, so they can be streamed to disk without building the whole
+        part file in memory.
+
+        Args:
+            edge_list (list): list of BioCypherEdges to be written
+
+            prop_dict (dict): properties of node class passed from parsing
+                function and their types
+
+        Yields:
+            str: one line of the part file, including the line break
+        """
+
+        # classify properties once per batch instead of once per edge and
+        # property: numeric types are written as they are, others quoted
+        prop_types = tuple(
+            (k, v in _NUMERIC_TYPES) for k, v in prop_dict.items()
+        )
+        # bind to locals, looked up for every property of every row
+        delim, adelim, quote = self.delim, self.adelim, self.quote
+        pascal = self._pascal
+
+        for e in edge_list:
+
+            e_props = e.get_properties()
+
+            if prop_dict:
 
                 plist = []
                 # make all into strings, put actual strings in quotes
-                for k, v in prop_dict.items():
+                for k, numeric in prop_types:
                     p = e_props.get(k)
                     if p is None:  # TODO make field empty instead of ""?
                         plist.append('')
-                    elif v in [
-                        'int',
-                        'long',
-                        'float',
-                        'double',
-                        'dbl',
-                        'bool',
-                        'boolean',
-                    ]:
+                    elif numeric:
                         plist.append(str(p))
                     else:
                         if isinstance(p, list):
-                            plist.append(
-                                self.quote + self.adelim.join(p) + self.quote
-                            )
+                            plist.append(f'{quote}{adelim.join(p)}{quote}')
                         elif '**' in p:
                             plist.append(
-                                self.quote + p.replace('**', self.adelim) +
-                                self.quote
+                                f"{quote}{p.replace('**', adelim)}{quote}"
                             )
                         else:
-                            plist.append(self.quote + str(p) + self.quote)
-
-                lines.append(
-                    self.delim.join(
-                        [
-                            e.get_source_id(),
-                            # here we need a list of properties in
-                            # the same order as in the header
-                            self.delim.join(plist),
-                            e.get_target_id(),
-                            self.translator.
-                            name_sentence_to_pascal(e.get_label(), ),
-                        ],
-                    ) + '\n',
-                )
-            else:
-                lines.append(
-                    self.delim.join(
-                        [
-                            e.get_source_id(),
-                            e.get_target_id(),
-                            self.translator.
-                            name_sentence_to_pascal(e.get_label(), ),
-                        ],
-                    ) + '\n',
-                )
-
-        # avoid writing empty files
-        if lines:
-            self._write_next_part(label, lines)
+                            plist.append(f'{quote}{p!s}{quote}')
 
-        return True
+                yield delim.join(
+                    [
+                        e.get_source_id(),
+                        # here we need a list of properties in
+                        # the same order as in the header
+                        delim.join(plist),
+                        e.get_target_id(),
+                        pascal(e.get_label()),
+                    ],
+                ) + '\n'
+            else:
+                yield delim.join(
+                    [
+                        e.get_source_id(),
+                        e.get_target_id(),
+                        pascal(e.get_label()),
+                    ],
+                ) + '\n'
 
-    def _write_next_part(self, label: str, lines: list):
+    def _write_next_part(
+        self,
+        label: str,
+        lines: Iterable[str],
+        n_lines: int,
+    ):
         """
-        This function writes a list of strings to a new part file.
+        This function writes lines of strings to a new part file. The
+        lines are consumed one by one, so a generator can be passed to
+        avoid holding the whole part in memory.
 
         Args:
             label (str): the label (type) of the edge; internal
             representation sentence case -> needs to become PascalCase
             for disk representation
 
-            lines (list): list of strings to be written
+            lines (iterable): strings to be written
+
+            n_lines (int): number of lines, for logging
 
         Returns:
             bool: The return value. True for success, False otherwise.
         """
         # translate label to PascalCase
-        label = self.translator.name_sentence_to_pascal(label)
-
-        # list files in self.outdir
-        files = glob.glob(os.path.join(self.outdir, f'{label}-part*.csv'))
-        # find file with highest part number
-        if files:
-            next_part = (
-                max(
-                    [
-                        int(
-                            f.split('.')[-2].split('-')[-1].replace('part', '')
-                        ) for f in files
-                    ],
-                ) + 1
-            )
-        else:
-            next_part = 0
+        label = self._pascal(label)
+
+        # next part number of this label; the file is created exclusively,
+        # parts written to the directory by others since the writer was
+        # created are skipped instead of overwritten
+        next_part = self._next_parts.get(label, 0)
+        while True:
+            part_file = f'{label}-part{next_part:03d}.csv'
+            file_path = os.path.join(self.outdir, part_file)
+            try:
+                f = open(file_path, 'x', encoding='utf-8')
+            except FileExistsError:
+                next_part += 1
+            else:
+                break
+        self._next_parts[label] = next_part + 1
 
         # write to file
-        padded_part = str(next_part).zfill(3)
-        logger.info(
-            f'Writing {len(lines)} entries to {label}-part{padded_part}.csv',
-        )
-        file_path = os.path.join(self.outdir, f'{label}-part{padded_part}.csv')
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-
-            # concatenate with delimiter
-            f.writelines(lines)
+        logger.info(f'Writing {n_lines} entries to {part_file}')
+
+        # join lines in chunks: fewer, larger writes, without building
+        # the whole part in memory
+        lines = iter(lines)
+        with f:
+
+            while True:
+                chunk = ''.join(itertools.islice(lines, 10000))
+                if not chunk:
+                    break
+                f.write(chunk)
 
     def get_import_call(self) -> str:
         """
@@ -15,18 +15,16 @@ def test_log_missing_bl_types(core, translator):
     assert mt.get('a') == 1 and mt.get('b') == 2
 
 
-# def test_access_translate(driver):
-
-#     driver.start_ontology()
-
-#     assert driver.translate_term('mirna') == 'MicroRNA'
-#     assert (driver.reverse_translate_term('SideEffect') == 'sider')
-#     assert (
-#         driver.translate_query('MATCH (n:reactome) RETURN n') ==
-#         'MATCH (n:Reactome.Pathway) RETURN n'
-#     )
-#     assert (
-#         driver.reverse_translate_query(
-#             'MATCH (n:Wikipathways.Pathway) RETURN n',
-#         ) == 'MATCH (n:wikipathways) RETURN n'
-#     )
+def test_access_translate(core):
+
+    assert core.translate_term('mirna') == 'MicroRNA'
+    assert (core.reverse_translate_term('SideEffect') == 'sider')
+    assert (
+        core.translate_query('MATCH (n:reactome) RETURN n') ==
+        'MATCH (n:Reactome.Pathway) RETURN n'
+    )
+    assert (
+        core.reverse_translate_query(
+            'MATCH (n:Wikipathways.Pathway) RETURN n',
+        ) == 'MATCH (n:wikipathways) RETURN n'
+    )
@@ -1,7 +1,7 @@
 import pytest
 import networkx as nx
 
-from biocypher._misc import create_tree_visualisation
+from biocypher._misc import to_list, ensure_iterable, create_tree_visualisation
 
 inheritance_tree = {
     'B': 'A',
@@ -50,6 +50,35 @@ def test_disjoint_tree():
         create_tree_visualisation(disjoint_tree)
 
 
+def test_to_list():
+
+    assert to_list('a') == ['a']
+    assert to_list(None) == [None]
+    assert to_list(1) == [1]
+    assert to_list(['a', 'b']) == ['a', 'b']
+
+    # lists are copied, callers may consume the result
+    l = ['a', 'b']
+    assert to_list(l) is not l
+
+    assert to_list(('a', 'b')) == ['a', 'b']
+    assert to_list({'a': 1}) == ['a']
+    assert to_list(x for x in 'ab') == ['a', 'b']
+
+
+def test_ensure_iterable():
+
+    assert ensure_iterable('a') == ('a', )
+    assert ensure_iterable(1) == (1, )
+    assert ensure_iterable(None) == (None, )
+
+    l = ['a', 'b']
+    assert ensure_iterable(l) is l
+
+    d = {'a': 1}
+    assert ensure_iterable(d) is d
+
+
 if __name__ == '__main__':
     # to look at it
     print(create_tree_visualisation(nx.DiGraph(inheritance_tree)).show())
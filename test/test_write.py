@@ -210,6 +210,37 @@ def test_write_node_data_from_gen_no_props(bw, path):
     assert 'ChemicalEntity' in mi
 
 
+def test_write_node_data_repeated_calls(bw, path):
+    # properties of microRNA are not in the schema config, the first
+    # node written defines them, also for subsequent calls
+    passed1 = bw.write_nodes(
+        [BioCypherNode(node_id='m1', node_label='microRNA')],
+    )
+    passed2 = bw.write_nodes(
+        [BioCypherNode(node_id='m2', node_label='microRNA')],
+    )
+    passed3 = bw.write_nodes(
+        [
+            BioCypherNode(
+                node_id='m3',
+                node_label='microRNA',
+                properties={'name': 'm3'},
+            ),
+        ],
+    )
+
+    m_csv = os.path.join(path, 'MicroRNA-part001.csv')
+
+    with open(m_csv) as f:
+        mi = f.read()
+
+    assert passed1 and passed2
+    assert not passed3
+    assert "m2;'m2';'id'" in mi
+    assert 'MicroRNA' in mi
+    assert not os.path.exists(os.path.join(path, 'MicroRNA-part002.csv'))
+
+
 @pytest.mark.parametrize('l', [int(1e4 + 4)], scope='module')
 def test_write_node_data_from_large_gen(bw, path, _get_nodes):
     nodes = _get_nodes
@@ -378,6 +409,58 @@ def test_accidental_exact_batch_size(bw, path, _get_nodes):
     )
 
 
+def test_write_next_part_existing_parts(bw, path, hybrid_ontology, translator):
+    # parts already in the output directory are continued, not overwritten
+    bw._write_next_part('protein', ['p1\n'], 1)
+
+    bw2 = _Neo4jBatchWriter(
+        ontology=hybrid_ontology,
+        translator=translator,
+        output_directory=path,
+        delimiter=';',
+        array_delimiter='|',
+        quote="'",
+    )
+    bw2._write_next_part('protein', ['p2\n'], 1)
+    bw2._write_next_part('protein', ['p3\n'], 1)
+
+    with open(os.path.join(path, 'Protein-part000.csv')) as f:
+        p0 = f.read()
+    with open(os.path.join(path, 'Protein-part002.csv')) as f:
+        p2 = f.read()
+
+    assert p0 == 'p1\n' and p2 == 'p3\n'
+    assert not isfile(os.path.join(path, 'Protein-part003.csv'))
+
+
+def test_write_next_part_shared_directory(
+    bw,
+    path,
+    hybrid_ontology,
+    translator,
+):
+    # two writers created on the same directory before either writes;
+    # parts of one are not overwritten by the other
+    bw2 = _Neo4jBatchWriter(
+        ontology=hybrid_ontology,
+        translator=translator,
+        output_directory=path,
+        delimiter=';',
+        array_delimiter='|',
+        quote="'",
+    )
+    bw._write_next_part('protein', ['p1\n'], 1)
+    bw2._write_next_part('protein', ['p2\n'], 1)
+    bw._write_next_part('protein', ['p3\n'], 1)
+
+    parts = []
+    for i in range(3):
+        with open(os.path.join(path, f'Protein-part00{i}.csv')) as f:
+            parts.append(f.read())
+
+    assert parts == ['p1\n', 'p2\n', 'p3\n']
+
+
 @pytest.mark.parametrize('l', [4], scope='module')
 def test_write_edge_data_from_gen(bw, path, _get_edges):
     edges = _get_edges
@@ -541,6 +624,30 @@ def test_write_duplicate_edges(bw, path, _get_edges):
     assert passed and l == 4 and c == 4
 
 
+def test_write_edges_separator_in_ids(bw, path):
+    edges = [
+        BioCypherEdge(
+            source_id='p_1',
+            target_id='p2',
+            relationship_label='PERTURBED_IN_DISEASE',
+        ),
+        BioCypherEdge(
+            source_id='p',
+            target_id='1_p2',
+            relationship_label='PERTURBED_IN_DISEASE',
+        ),
+    ]
+
+    passed = bw.write_edges(edges)
+
+    ptl_csv = os.path.join(path, 'PERTURBED_IN_DISEASE-part000.csv')
+
+    l = sum(1 for _ in open(ptl_csv))
+
+    assert passed and l == 2
+    assert not bw.duplicate_edge_ids
+
+
 def test_BioCypherRelAsNode_implementation(bw, path):
     trips = _get_rel_as_nodes(4)
 
@@ -614,6 +721,33 @@ def test_RelAsNode_overwrite_behaviour(bw, path):
     assert passed1 and passed2 and isfile(iso_csv)
 
 
+def test_RelAsNode_batch_size(bw, path):
+    # the node half of relationships as nodes is batched like the edges
+    trips = _get_rel_as_nodes(5)
+
+    def gen(lis):
+        yield from lis
+
+    passed = bw.write_edges(gen(trips), batch_size=2)
+
+    pmi_csv0 = os.path.join(path, 'PostTranslationalInteraction-part000.csv')
+    pmi_csv1 = os.path.join(path, 'PostTranslationalInteraction-part001.csv')
+    pmi_csv2 = os.path.join(path, 'PostTranslationalInteraction-part002.csv')
+
+    with open(pmi_csv0) as f:
+        p0 = f.read()
+    with open(pmi_csv2) as f:
+        p2 = f.read()
+
+    assert passed
+    assert isfile(pmi_csv1)
+    assert "i1;True;-1;'i1';'id'" in p0
+    assert "i5;True;-1;'i5';'id'" in p2
+    assert not isfile(
+        os.path.join(path, 'PostTranslationalInteraction-part003.csv'),
+    )
+
+
 def test_write_mixed_edges(bw, path):
     mixed = []
     le = 4